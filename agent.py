@@ -71,6 +71,7 @@ Rules:
 - Always inspect server response.
 - Never stop early.
 - Use tools for HTML, downloading, rendering, OCR, or running code.
+- When a task needs several files, call download_file for all of them in the same turn; they are fetched in parallel.
 - Include:
     email = {EMAIL}
     secret = {SECRET}
@@ -164,9 +165,8 @@ def route(state):
     last = state["messages"][-1]
     
     # 1. CHECK FOR MALFORMED FUNCTION CALLS
-    if "finish_reason" in last.response_metadata:
-        if last.response_metadata["finish_reason"] == "MALFORMED_FUNCTION_CALL":
-            return "handle_malformed"
+    if last.response_metadata.get("finish_reason") == "MALFORMED_FUNCTION_CALL":
+        return "handle_malformed"
 
     # 2. CHECK FOR VALID TOOLS
     tool_calls = getattr(last, "tool_calls", None)
@@ -176,13 +176,11 @@ def route(state):
 
     # 3. CHECK FOR END
     content = getattr(last, "content", None)
+    if isinstance(content, list) and content and isinstance(content[0], dict):
+        content = content[0].get("text", "")
     if isinstance(content, str) and content.strip() == "END":
         return END
 
-    if isinstance(content, list) and len(content) and isinstance(content[0], dict):
-        if content[0].get("text", "").strip() == "END":
-            return END
-
     print("Route → agent")
     return "agent"
 
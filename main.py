@@ -2,11 +2,14 @@ from fastapi import FastAPI, Request, BackgroundTasks
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from pydantic import BaseModel, Field, ValidationError
 from agent import run_agent
 from dotenv import load_dotenv
 import uvicorn
+import hmac
 import os
-from shared_store import url_time, BASE64_STORE
+from shared_store import url_time, BASE64_STORE, HTTP_SESSION
+from tools.web_scraper import warm_browser, close_browser
 import time
 
 load_dotenv()
@@ -14,6 +17,13 @@ load_dotenv()
 EMAIL = os.getenv("EMAIL") 
 SECRET = os.getenv("SECRET")
 
+
+class QuizRequest(BaseModel):
+    url: str = Field(min_length=1)
+    secret: str = Field(min_length=1)
+    email: str | None = None
+
+
 app = FastAPI()
 app.add_middleware(
     CORSMiddleware,
@@ -23,6 +33,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 START_TIME = time.time()
+
+@app.on_event("startup")
+def startup():
+    """Launch the shared browser so the first quiz page renders warm."""
+    warm_browser()
+
+@app.on_event("shutdown")
+def shutdown():
+    close_browser()
+    HTTP_SESSION.close()
+
 @app.get("/healthz")
 def healthz():
     """Simple liveness check."""
@@ -33,21 +54,18 @@ def healthz():
 
 @app.post("/solve")
 async def solve(request: Request, background_tasks: BackgroundTasks):
+    # Decode and validate in one step; any malformed or incomplete body is a 400.
     try:
-        data = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON")
-    if not data:
+        quiz = QuizRequest.model_validate_json(await request.body())
+    except ValidationError:
         raise HTTPException(status_code=400, detail="Invalid JSON")
-    url = data.get("url")
-    secret = data.get("secret")
-    if not url or not secret:
-        raise HTTPException(status_code=400, detail="Invalid JSON")
-    
-    if secret != SECRET:
+    url = quiz.url
+
+    if SECRET is None or not hmac.compare_digest(quiz.secret.encode(), SECRET.encode()):
         raise HTTPException(status_code=403, detail="Invalid secret")
     url_time.clear() 
     BASE64_STORE.clear()  
+    HTTP_SESSION.cookies.clear()
     print("Verified starting the task...")
     os.environ["url"] = url
     os.environ["offset"] = "0"
@@ -1,2 +1,17 @@
+import requests
+from requests.adapters import HTTPAdapter
+
 BASE64_STORE = {}
-url_time = {}
\ No newline at end of file
+url_time = {}
+
+# One pooled session for every outgoing HTTP call so TCP/TLS connections to
+# the quiz and submit hosts are reused across tool invocations. Its cookie
+# jar is cleared at the start of every /solve run alongside the stores above.
+HTTP_SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+HTTP_SESSION.mount("http://", _adapter)
+HTTP_SESSION.mount("https://", _adapter)
+
+# (connect, read) seconds; requests has no session-wide default, so pass it
+# on each call.
+HTTP_TIMEOUT = (5.0, 30.0)
@@ -19,13 +19,14 @@ def transcribe_audio(file_path: str) -> str:
         - Requires `pydub` and `speech_recognition` packages.
         - Uses Google's free recognize_google() API (requires internet).
     """
+    file_path = os.path.join("LLMFiles", file_path)
+    final_path = file_path
     try:
         # Convert MP3 → WAV if needed
-        file_path = os.path.join("LLMFiles", file_path)
-        final_path = file_path
-        if file_path.lower().endswith(".mp3"):
+        stem, ext = os.path.splitext(file_path)
+        if ext.lower() == ".mp3":
             sound = AudioSegment.from_mp3(file_path)
-            final_path = file_path.replace(".mp3", ".wav")
+            final_path = stem + ".wav"
             sound.export(final_path, format="wav")
 
         # Speech recognition
@@ -34,10 +35,10 @@ def transcribe_audio(file_path: str) -> str:
             audio_data = recognizer.record(source)
             text = recognizer.recognize_google(audio_data)
 
-        # If we converted the file, remove temp wav
-        if final_path != file_path and os.path.exists(final_path):
-            os.remove(final_path)
-
         return text
     except Exception as e:
-        return f"Error occurred: {e}"
\ No newline at end of file
+        return f"Error occurred: {e}"
+    finally:
+        # If we converted the file, remove temp wav
+        if final_path != file_path and os.path.exists(final_path):
+            os.remove(final_path)
\ No newline at end of file
@@ -1,6 +1,49 @@
 from langchain_core.tools import tool
-import requests
+from collections import OrderedDict
+import threading
 import os
+from shared_store import HTTP_SESSION, HTTP_TIMEOUT
+
+# url -> (etag, last_modified, content). Quiz chains often point at the same
+# file more than once; with the validators stored a repeat download costs a
+# 304 instead of the full body. Bounded LRU by total size.
+ARTIFACT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_artifact_cache = OrderedDict()
+_artifact_cache_bytes = 0
+_artifact_cache_lock = threading.Lock()
+
+
+def _cache_get(url):
+    with _artifact_cache_lock:
+        entry = _artifact_cache.get(url)
+        if entry is not None:
+            _artifact_cache.move_to_end(url)
+        return entry
+
+
+def _pop_locked(url):
+    # Caller holds _artifact_cache_lock.
+    global _artifact_cache_bytes
+    old = _artifact_cache.pop(url, None)
+    if old is not None:
+        _artifact_cache_bytes -= len(old[2])
+
+
+def _cache_discard(url):
+    with _artifact_cache_lock:
+        _pop_locked(url)
+
+
+def _cache_put(url, etag, last_modified, content):
+    global _artifact_cache_bytes
+    with _artifact_cache_lock:
+        _pop_locked(url)
+        _artifact_cache[url] = (etag, last_modified, content)
+        _artifact_cache_bytes += len(content)
+        while _artifact_cache_bytes > ARTIFACT_CACHE_MAX_BYTES:
+            _, evicted = _artifact_cache.popitem(last=False)
+            _artifact_cache_bytes -= len(evicted[2])
+
 
 @tool
 def download_file(url: str, filename: str) -> str:
@@ -16,16 +59,50 @@ def download_file(url: str, filename: str) -> str:
         str: Full path to the saved file.
     """
     try:
-        response = requests.get(url, stream=True)
-        response.raise_for_status()
+        cached = _cache_get(url)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
         directory_name = "LLMFiles"
         os.makedirs(directory_name, exist_ok=True)
         path = os.path.join(directory_name, filename)
-        with open(path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
 
+        # A streamed response holds its connection until closed; the with
+        # block hands it back to the pool on every exit path.
+        with HTTP_SESSION.get(url, stream=True, headers=headers, timeout=HTTP_TIMEOUT) as response:
+            if cached is not None and response.status_code == 304:
+                with open(path, "wb") as f:
+                    f.write(cached[2])
+                return filename
+
+            response.raise_for_status()
+            # A fresh body supersedes whatever was cached; drop the old entry
+            # (and its validators) now and re-cache below only if allowed.
+            _cache_discard(url)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            # Only keep bodies the server lets us revalidate, and only while
+            # they fit in the cache budget.
+            chunks = [] if (etag or last_modified) else None
+            size = 0
+            with open(path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=8192):
+                    if chunk:
+                        f.write(chunk)
+                        if chunks is not None:
+                            size += len(chunk)
+                            if size > ARTIFACT_CACHE_MAX_BYTES:
+                                chunks = None
+                            else:
+                                chunks.append(chunk)
+
+        if chunks is not None:
+            _cache_put(url, etag, last_modified, b"".join(chunks))
         return filename
     except Exception as e:
-        return f"Error downloading file: {str(e)}"
\ No newline at end of file
+        return f"Error downloading file: {str(e)}"
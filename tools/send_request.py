@@ -1,5 +1,5 @@
 from langchain_core.tools import tool
-from shared_store import BASE64_STORE, url_time
+from shared_store import BASE64_STORE, url_time, HTTP_SESSION, HTTP_TIMEOUT
 import time
 import os
 import requests
@@ -50,7 +50,7 @@ def post_request(url: str, payload: Dict[str, Any], headers: Optional[Dict[str,
                 "url": payload.get("url", "")
             }
         print(f"\nSending Answer \n{json.dumps(sending, indent=4)}\n to url: {url}")
-        response = requests.post(url, json=payload, headers=headers)
+        response = HTTP_SESSION.post(url, json=payload, headers=headers, timeout=HTTP_TIMEOUT)
 
         # Raise on 4xx/5xx
         response.raise_for_status()
@@ -71,7 +71,7 @@ def post_request(url: str, payload: Dict[str, Any], headers: Optional[Dict[str,
         if not correct:
             cur_time = time.time()
             prev = url_time.get(next_url, time.time())
-            if cache[cur_url] >= retry_limit or delay >= 180 or (prev != "0" and (cur_time - float(prev)) > 90): # Shouldn't retry
+            if cache[cur_url] >= retry_limit or delay >= 180 or (cur_time - prev) > 90: # Shouldn't retry
                 print("Not retrying, moving on to the next question")
                 data = {"url": data.get("url", "")} 
             else: # Retry
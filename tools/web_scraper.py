@@ -1,7 +1,136 @@
 from langchain_core.tools import tool
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+# Playwright's sync API is bound to the thread that started it, so a single
+# worker thread owns the browser and every render is handed to it. This keeps
+# one Chromium alive across tool calls instead of cold-starting it each time.
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="playwright")
+_playwright = None
+_browser = None
+
+# Renders run one at a time on that thread, so this bounds the wait in line
+# as well as the render itself; a hung page can't stall the agent forever.
+RENDER_TIMEOUT = 90
+
+# Quiz pages are read for their DOM only; skipping these saves bandwidth.
+# <img> src attributes are still reported since they come from the DOM.
+BLOCKED_RESOURCES = {"image", "font", "media"}
+
+# HTML beyond this is cut off before it leaves the browser, so a huge page
+# never gets copied over the CDP connection or into the LLM context.
+MAX_HTML_CHARS = 300000
+
+# One evaluate() round-trip for everything the tool returns. img.src is
+# already resolved against the page URL by the browser.
+EXTRACT_JS = """(maxChars) => {
+    const html = document.documentElement.outerHTML;
+    // slice() counts UTF-16 units; don't cut a surrogate pair in half, or the
+    // lone surrogate can't be UTF-8 encoded for the LLM request.
+    let end = maxChars;
+    const c = html.charCodeAt(end - 1);
+    if (c >= 0xD800 && c <= 0xDBFF) end--;
+    return {
+        html: html.slice(0, end),
+        length: html.length,
+        images: Array.from(document.querySelectorAll('img[src]'), e => e.src),
+    };
+}"""
+
+
+def _launch():
+    global _playwright
+    if _playwright is None:
+        _playwright = sync_playwright().start()
+    return _playwright.chromium.launch(headless=True)
+
+
+def _get_browser():
+    """Return the shared browser, launching it on first use or after a crash."""
+    global _playwright, _browser
+    if _browser is None or not _browser.is_connected():
+        try:
+            _browser = _launch()
+        except Exception:
+            # The Playwright driver connection itself may have died; restart
+            # it and retry once rather than failing every later render.
+            if _playwright is not None:
+                try:
+                    _playwright.stop()
+                except Exception:
+                    pass
+                _playwright = None
+            _browser = _launch()
+    return _browser
+
+
+def _block_heavy(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCES and not request.is_navigation_request():
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _render(url: str) -> dict:
+    """Render the page in a fresh context (runs on the playwright thread)."""
+    context = _get_browser().new_context()
+    try:
+        context.route("**/*", _block_heavy)
+        page = context.new_page()
+
+        # Don't block goto on networkidle (it never settles on pages that
+        # poll); wait for load, then give fetch()/XHR-rendered content a short
+        # bounded chance to arrive. Both waits are best-effort.
+        page.goto(url, wait_until="domcontentloaded", timeout=30000)
+        try:
+            page.wait_for_load_state("load", timeout=5000)
+        except PlaywrightTimeoutError:
+            pass
+        try:
+            page.wait_for_load_state("networkidle", timeout=3000)
+        except PlaywrightTimeoutError:
+            pass
+        state = page.evaluate(EXTRACT_JS, MAX_HTML_CHARS)
+    finally:
+        # Closing the context also closes its page; the browser stays up.
+        context.close()
+    return state
+
+
+def _shutdown():
+    global _playwright, _browser
+    if _browser is not None:
+        _browser.close()
+        _browser = None
+    if _playwright is not None:
+        _playwright.stop()
+        _playwright = None
+
+
+def warm_browser():
+    """Start launching the shared browser without waiting for it.
+
+    Called from the app's startup hook, which runs on the event loop; the
+    launch happens on the playwright thread and the first render simply
+    queues behind it. A failed launch is logged here and retried by the next
+    render.
+    """
+    _executor.submit(_get_browser).add_done_callback(_report_warm_failure)
+
+
+def _report_warm_failure(future):
+    if future.exception() is not None:
+        print(f"Warning: browser warm-up failed: {future.exception()}")
+
+
+def close_browser():
+    """Close the shared browser and stop Playwright."""
+    try:
+        _executor.submit(_shutdown).result(timeout=10)
+    except FutureTimeoutError:
+        print("Warning: playwright thread busy, skipping browser shutdown")
+
 
 @tool
 def get_rendered_html(url: str) -> dict:
@@ -10,28 +139,22 @@ def get_rendered_html(url: str) -> dict:
     """
     print("\nFetching and rendering:", url)
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-
-            page.goto(url, wait_until="networkidle")
-            content = page.content()
-
-            browser.close()
-
-            # Parse images
-            soup = BeautifulSoup(content, "html.parser")
-            imgs = [urljoin(url, img["src"]) for img in soup.find_all("img", src=True)]
-            if len(content) > 300000:
-                    print("Warning: HTML too large, truncating...")
-                    content = content[:300000] + "... [TRUNCATED DUE TO SIZE]"
-            return {
-                "html": content,
-                "images": imgs,
-                "url": url
-            }
+        future = _executor.submit(_render, url)
+        try:
+            state = future.result(timeout=RENDER_TIMEOUT)
+        except FutureTimeoutError:
+            future.cancel()
+            return {"error": f"Error fetching/rendering page: timed out after {RENDER_TIMEOUT}s"}
+
+        content = state["html"]
+        if state["length"] > MAX_HTML_CHARS:
+                print(f"Warning: HTML too large ({state['length']} chars), truncating...")
+                content += "... [TRUNCATED DUE TO SIZE]"
+        return {
+            "html": content,
+            "images": state["images"],
+            "url": url
+        }
 
     except Exception as e:
         return {"error": f"Error fetching/rendering page: {str(e)}"}
-
-